@@ -4,14 +4,90 @@ Auto-translate empty msgstr entries in .po files using DeepLX
 """
 
 import os
-import re
 import sys
 import argparse
-import time
+import asyncio
+import email.utils
+import hashlib
+import importlib.util
 import json
+import pickle
+import random
+import re
+import sqlite3
+import time
 import httpx
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from json.encoder import encode_basestring_ascii as _json_string
 from pathlib import Path
 
+try:
+    # Optional faster event loop (pip install uvloop, not available on Windows)
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    # Optional faster JSON codec (pip install orjson)
+    import orjson
+except ImportError:
+    orjson = None
+
+# Connection pool settings for the shared translation client. All requests
+# reuse pooled keep-alive connections instead of paying a fresh TCP/TLS
+# handshake per call. HTTP/2 is only enabled when the optional 'h2' package
+# is installed (pip install httpx[http2]).
+HTTP2_ENABLED = importlib.util.find_spec('h2') is not None
+HTTP_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Upper bound for computed retry backoff delays (Retry-After is honored as-is)
+MAX_BACKOFF = 30.0
+
+# DeepL accepts at most 50 texts and 128 KiB of request body per call;
+# batches are packed up to these limits with some headroom for JSON overhead
+MAX_BATCH_TEXTS = 50
+MAX_BATCH_BYTES = 100_000
+
+# Circuit breaker shared by all requests: after BREAKER_THRESHOLD consecutive
+# failed requests (connection errors and non-rate-limit HTTP errors), further
+# requests fail fast for BREAKER_COOLDOWN seconds
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 60.0
+_breaker = {'state': 'closed', 'failures': 0, 'opened_at': 0.0}
+
+def _user_cache_dir():
+    """Per-user cache directory, following each platform's convention"""
+    home = Path.home()
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or home / 'AppData' / 'Local'
+    elif sys.platform == 'darwin':
+        base = home / 'Library' / 'Caches'
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or home / '.cache'
+    return Path(base) / 'translate_po'
+
+# Persistent translation and parse cache, shared across runs and .po files.
+# Bump PARSE_CACHE_VERSION whenever the layout of parsed entries changes.
+CACHE_FILE = _user_cache_dir() / 'cache.sqlite'
+PARSE_CACHE_VERSION = 4
+
+# Escape sequences used in quoted .po strings
+_PO_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\t': '\\t', '\r': '\\r'})
+_PO_UNESCAPES = {'n': '\n', 't': '\t', 'r': '\r'}
+_PO_UNESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+
+# Format placeholders (%s, %(name)s, {0}), HTML tags/entities and escape
+# sequences. A msgid with no letters left after removing these has nothing
+# for DeepL to translate.
+_PLACEHOLDER_RE = re.compile(r'%(?:\([^)]*\))?[-+ #0-9.$]*[a-zA-Z%]|\{[^{}]*\}|<[^>]+>|&#?\w+;|\\.')
+
+# Minimum number of .po files before parsing is spread over a process pool
+PARALLEL_PARSE_MIN_FILES = 8
+
 # Language code mapping for DeepL
 # DeepL uses different language codes than our po files
 DEEPL_LANGUAGE_MAP = {
@@ -62,92 +138,387 @@ LANGUAGE_NAMES = {
     'id': 'Indonesian',
 }
 
+# Subdirectories of the po directory that do not hold a language
+_SKIP_DIRS = frozenset({'templates'})
+
+# Combined lookup: po language code -> (DeepL code, display name)
+_LANG_INFO = {code: (deepl, LANGUAGE_NAMES.get(code, code)) for code, deepl in DEEPL_LANGUAGE_MAP.items()}
+
+@dataclass(slots=True)
+class PoEntry:
+    """A msgid/msgstr pair parsed from a .po file
+
+    `msgid` and `msgstr` are kept in their escaped .po form. `msgstr_span`
+    holds the (start, end) character offsets of the msgstr line.
+    """
+    msgid: str
+    msgstr: str
+    msgstr_span: tuple
+    is_empty: bool
+
+def _make_entry(fields, msgstr_span):
+    """Build an entry from the fields collected for one block, or None"""
+    if 'msgid' not in fields or 'msgstr' not in fields:
+        return None
+    msgstr = ''.join(fields['msgstr'])
+    return PoEntry(''.join(fields['msgid']), msgstr, msgstr_span, msgstr == '')
+
+def iter_po_entries(file_path):
+    """Iterate over the entries of a .po file
+
+    Streams the file line by line in a single pass, dispatching on the first
+    character of each line. An entry ends at a blank line, at the msgid or
+    msgctxt of the next entry, or at a comment following its msgstr. Each
+    entry records
+    `msgstr_span`, the (start, end) character offsets of its msgstr line, so
+    translations can be written back without searching the file.
+    """
+    fields = {}
+    key = None
+    msgstr_span = None
+    offset = 0
+
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        for line in f:
+            line_start = offset
+            offset += len(line)
+            stripped = line.strip()
+            first = stripped[:1]
+            keyword, _, value = stripped.partition(' ') if first == 'm' else ('', '', '')
+
+            # End of the current entry: a blank line, the start of the next
+            # entry, or a comment after the msgstr
+            if (not stripped
+                    or (keyword in ('msgid', 'msgctxt') and 'msgid' in fields)
+                    or (first == '#' and 'msgstr' in fields)):
+                entry = _make_entry(fields, msgstr_span)
+                if entry:
+                    yield entry
+                fields = {}
+                key = None
+                msgstr_span = None
+                if not stripped:
+                    continue
+
+            if first == '"':
+                # Continuation of a multi-line string
+                if key:
+                    fields[key].append(stripped[1:-1])
+            elif first == 'm':
+                # msgctxt, msgid_plural and msgstr[N] are not tracked
+                key = keyword if keyword in ('msgid', 'msgstr') else None
+                if key:
+                    fields[key] = [value.strip()[1:-1]]
+                if key == 'msgstr':
+                    start = line_start + len(line) - len(line.lstrip())
+                    msgstr_span = (start, start + len(stripped))
+            else:
+                # Comments ('#') are not part of any value
+                key = None
+
+    entry = _make_entry(fields, msgstr_span)
+    if entry:
+        yield entry
+
 def parse_po_file(file_path):
     """Parse a .po file and return list of entries"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    return list(iter_po_entries(file_path))
 
-    entries = []
-    # Split by empty lines to get individual entries
-    blocks = re.split(r'\n\n+', content)
+def scan_po_file(file_path):
+    """Scan a .po file for untranslated entries
 
-    for block in blocks:
-        if not block.strip():
-            continue
+    Only the untranslated entries are kept in memory.
+
+    Returns:
+        Tuple of (list of untranslated entries, total number of entries)
+    """
+    untranslated = []
+    total = 0
+    for entry in iter_po_entries(file_path):
+        total += 1
+        if entry.is_empty and entry.msgid:
+            untranslated.append(entry)
+    return untranslated, total
+
+def apply_msgstr_patches(content, patches):
+    """Replace msgstr lines in file content in a single pass
+
+    Args:
+        content: Original file content
+        patches: List of ((start, end), msgstr) tuples, where (start, end)
+            is an entry's `msgstr_span`
 
-        # Extract msgid and msgstr
-        msgid_match = re.search(r'msgid\s+"([^"]*)"', block)
-        msgstr_match = re.search(r'msgstr\s+"([^"]*)"', block)
-
-        if msgid_match and msgstr_match:
-            msgid = msgid_match.group(1)
-            msgstr = msgstr_match.group(1)
-
-            # Handle multi-line strings
-            if '""' in block:
-                # Multi-line msgid
-                msgid_lines = re.findall(r'msgid\s+""\n((?:\s*"[^"]*"\n?)+)', block)
-                if msgid_lines:
-                    msgid = ''.join(re.findall(r'"([^"]*)"', msgid_lines[0]))
-
-                # Multi-line msgstr
-                msgstr_lines = re.findall(r'msgstr\s+""\n((?:\s*"[^"]*"\n?)+)', block)
-                if msgstr_lines:
-                    msgstr = ''.join(re.findall(r'"([^"]*)"', msgstr_lines[0]))
-
-            entries.append({
-                'msgid': msgid,
-                'msgstr': msgstr,
-                'block': block,
-                'is_empty': msgstr == ''
-            })
-
-    return entries
-
-def find_untranslated_entries(po_dir):
-    """Find all untranslated entries in po directory"""
-    po_dir = Path(po_dir)
+    Returns:
+        New file content
+    """
+    pieces = []
+    prev = 0
+    for (start, end), msgstr in sorted(patches):
+        pieces.append(content[prev:start])
+        pieces.append(f'msgstr "{msgstr}"')
+        prev = end
+    pieces.append(content[prev:])
+    return ''.join(pieces)
+
+def find_untranslated_entries(po_dir, cache=None):
+    """Find all untranslated entries in po directory
+
+    Files unchanged since the last run (same mtime and size) are served from
+    the parse cache. The rest are parsed in a process pool when there are
+    enough of them to outweigh the cost of starting the worker processes.
+    """
     results = {}
+    po_files = []
 
-    for lang_dir in po_dir.iterdir():
-        if not lang_dir.is_dir():
-            continue
-        if lang_dir.name == 'templates':
-            continue
+    # os.scandir reuses the file type from the directory listing, so no
+    # extra stat() call is needed per entry
+    with os.scandir(po_dir) as entries:
+        lang_dirs = sorted(
+            (d for d in entries if d.name not in _SKIP_DIRS and d.is_dir()),
+            key=lambda d: d.name
+        )
 
+    for lang_dir in lang_dirs:
         lang_code = lang_dir.name
-        lang_name = LANGUAGE_NAMES.get(lang_code, lang_code)
-        deepl_code = DEEPL_LANGUAGE_MAP.get(lang_code)
+        lang_info = _LANG_INFO.get(lang_code)
 
-        if not deepl_code:
+        if not lang_info:
             print(f"Warning: Language {lang_code} not supported by DeepL, skipping...")
             continue
 
-        for po_file in lang_dir.glob('*.po'):
-            entries = parse_po_file(po_file)
-            untranslated = [e for e in entries if e['is_empty'] and e['msgid']]
-
-            if untranslated:
-                results[str(po_file)] = {
-                    'lang_code': lang_code,
-                    'lang_name': lang_name,
-                    'deepl_code': deepl_code,
-                    'untranslated': untranslated,
-                    'total': len(entries)
-                }
+        deepl_code, lang_name = lang_info
+
+        with os.scandir(lang_dir.path) as files:
+            for po_file in files:
+                if po_file.name.endswith('.po') and po_file.is_file():
+                    po_files.append((po_file.path, lang_code, lang_name, deepl_code))
+
+    scanned = {}
+    stamps = {}
+    if cache:
+        for po_file, *_ in po_files:
+            stamps[po_file] = _file_stamp(po_file)
+            scan = parse_cache_lookup(cache, po_file, stamps[po_file])
+            if scan is not None:
+                scanned[po_file] = scan
+
+    paths = [po_file for po_file, *_ in po_files if po_file not in scanned]
+    if len(paths) >= PARALLEL_PARSE_MIN_FILES:
+        # Never start more workers than files; send each worker a few
+        # chunks so uneven file sizes still balance out
+        workers = min(os.cpu_count() or 1, len(paths))
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            scanned.update(zip(paths, executor.map(scan_po_file, paths, chunksize=chunksize)))
+    else:
+        scanned.update((path, scan_po_file(path)) for path in paths)
+
+    if cache and paths:
+        parse_cache_store(cache, [(path, stamps[path], scanned[path]) for path in paths])
+
+    for po_file, lang_code, lang_name, deepl_code in po_files:
+        untranslated, total = scanned[po_file]
+        if untranslated:
+            results[po_file] = {
+                'lang_code': lang_code,
+                'lang_name': lang_name,
+                'deepl_code': deepl_code,
+                'untranslated': untranslated,
+                'total': total
+            }
 
     return results
 
-def translate_text_deepl(text, target_lang, api_url, endpoint_type="free", max_retries=3, request_delay=1.0):
+def open_cache(path=CACHE_FILE):
+    """Open (and create if needed) the on-disk translation and parse cache"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    cache = sqlite3.connect(str(path))
+    cache.execute('CREATE TABLE IF NOT EXISTS tx(k TEXT PRIMARY KEY, v TEXT)')
+    cache.execute('CREATE TABLE IF NOT EXISTS po(path TEXT PRIMARY KEY, stamp TEXT, scan BLOB)')
+    return cache
+
+def _file_stamp(path):
+    """Identify a file version by its modification time and size"""
+    st = os.stat(path)
+    return f"{PARSE_CACHE_VERSION}:{st.st_mtime_ns}:{st.st_size}"
+
+def parse_cache_lookup(cache, path, stamp):
+    """Return the cached scan_po_file() result for a file, or None if stale
+
+    Unreadable cache rows are treated as a miss.
+    """
+    row = cache.execute('SELECT stamp, scan FROM po WHERE path=?', (path,)).fetchone()
+    if not row or row[0] != stamp:
+        return None
+    try:
+        fields, total = pickle.loads(row[1])
+        untranslated = [PoEntry(msgid, msgstr, tuple(span), msgstr == '') for msgid, msgstr, span in fields]
+    except (pickle.UnpicklingError, AttributeError, ImportError, EOFError, TypeError, ValueError):
+        return None
+    return untranslated, total
+
+def parse_cache_store(cache, scans):
+    """Store a list of (path, stamp, scan_po_file() result) tuples
+
+    Entries are stored as plain (msgid, msgstr, msgstr_span) tuples, so the
+    cache does not depend on the module PoEntry was loaded from.
+    """
+    rows = []
+    for path, stamp, (untranslated, total) in scans:
+        fields = [(entry.msgid, entry.msgstr, entry.msgstr_span) for entry in untranslated]
+        rows.append((path, stamp, pickle.dumps((fields, total))))
+    cache.executemany('INSERT OR REPLACE INTO po(path, stamp, scan) VALUES (?, ?, ?)', rows)
+    cache.commit()
+
+def _cache_key(text, target_lang):
+    return hashlib.sha256(f"{target_lang}\x00{text}".encode('utf-8')).hexdigest()
+
+def cache_lookup(cache, texts, target_lang):
+    """Return a {text: translation} dict of the texts found in the cache"""
+    found = {}
+    for text in texts:
+        row = cache.execute('SELECT v FROM tx WHERE k=?', (_cache_key(text, target_lang),)).fetchone()
+        if row:
+            found[text] = row[0]
+    return found
+
+def cache_store(cache, translations, target_lang):
+    """Store a {text: translation} dict in the cache"""
+    cache.executemany(
+        'INSERT OR REPLACE INTO tx(k, v) VALUES (?, ?)',
+        [(_cache_key(text, target_lang), translation) for text, translation in translations.items()]
+    )
+    cache.commit()
+
+class RequestLimiter:
+    """Limit concurrent requests and space out request starts
+
+    Used as an async context manager around each HTTP request. At most
+    `concurrency` requests are in flight at once, and consecutive requests
+    start at least `delay` seconds apart to avoid rate limiting.
+    """
+
+    def __init__(self, concurrency=4, delay=0.5):
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._delay = delay
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_start)
+        self._next_start = start + self._delay
+        if start > now:
+            await asyncio.sleep(start - now)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._semaphore.release()
+
+def retry_after_seconds(response):
+    """Return the wait requested by a Retry-After header in seconds, or None
+
+    Supports both the delay-seconds and the HTTP-date forms.
+    """
+    value = response.headers.get('Retry-After', '').strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+def jittered(wait_time):
+    """Randomize a backoff delay (equal jitter) so concurrent retries spread out
+
+    The result is capped at MAX_BACKOFF seconds.
+    """
+    return random.uniform(0.5, 1.0) * min(wait_time, MAX_BACKOFF)
+
+def circuit_allows_request():
+    """Check whether the circuit breaker lets a request through
+
+    While open, requests are refused until the cooldown has passed; then a
+    single probe request is let through (half-open state).
+    """
+    if _breaker['state'] == 'closed':
+        return True
+    if _breaker['state'] == 'open' and time.monotonic() - _breaker['opened_at'] >= BREAKER_COOLDOWN:
+        _breaker['state'] = 'half_open'
+        return True
+    return False
+
+def record_request_result(success):
+    """Update the circuit breaker with the outcome of a request"""
+    if success:
+        _breaker['state'] = 'closed'
+        _breaker['failures'] = 0
+        return
+
+    _breaker['failures'] += 1
+    if _breaker['state'] == 'half_open' or (
+            _breaker['state'] == 'closed' and _breaker['failures'] >= BREAKER_THRESHOLD):
+        print(f"       ✗ {_breaker['failures']} consecutive request failures, circuit open: "
+              f"giving up on requests for {BREAKER_COOLDOWN:.0f}s")
+        _breaker['state'] = 'open'
+        _breaker['opened_at'] = time.monotonic()
+
+def json_dumps(data):
+    """Serialize a request payload to JSON bytes"""
+    if orjson:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('ascii')
+
+def json_loads(content):
+    """Deserialize a JSON response body"""
+    if orjson:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def create_client():
+    """Create the pooled HTTP client shared by all translation requests"""
+    return httpx.AsyncClient(http2=HTTP2_ENABLED, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+async def warm_up_client(client, api_url):
+    """Open a connection to the API ahead of the first translation request
+
+    Sends a cheap OPTIONS request so the TCP/TLS (and HTTP/2) handshake is
+    done before the batches are dispatched. Failures are ignored - the real
+    requests report their own errors.
+    """
+    try:
+        await client.request("OPTIONS", api_url, timeout=5.0)
+    except httpx.HTTPError:
+        pass
+
+async def translate_texts_individually(client, texts, target_lang, api_url, endpoint_type, max_retries, limiter):
+    """Translate a list of texts with one request per text
+
+    Returns:
+        List of translated texts, or None if any of them failed
+    """
+    results = await asyncio.gather(*(
+        translate_text_deepl(client, text, target_lang, api_url, endpoint_type, max_retries, limiter)
+        for text in texts
+    ))
+    if any(result is None for result in results):
+        return None
+    return list(results)
+
+async def translate_text_deepl(client, text, target_lang, api_url, endpoint_type="free", max_retries=3, limiter=None):
     """Translate text using DeepL API with retry logic
 
     Args:
+        client: Shared httpx.AsyncClient used for the request
         text: Text to translate (string or list of strings for batch)
         target_lang: Target language code (e.g., 'ZH', 'DE')
         api_url: API endpoint URL
         endpoint_type: Type of endpoint - 'free', 'pro', or 'official'
         max_retries: Maximum number of retry attempts
-        request_delay: Delay between individual requests in free endpoint batch mode
+        limiter: Optional RequestLimiter throttling the HTTP requests
 
     Returns:
         Translated text (string) or list of translated texts for batch
@@ -155,191 +526,322 @@ def translate_text_deepl(text, target_lang, api_url, endpoint_type="free", max_r
     # Check if batch translation
     is_batch = isinstance(text, list)
 
-    # Free endpoint doesn't support batch - translate one by one
+    if limiter is None:
+        limiter = RequestLimiter()
+
+    # Free endpoint doesn't support batch - translate texts individually
     if is_batch and endpoint_type == "free":
-        print(f"       [INFO] Free endpoint doesn't support batch, translating {len(text)} texts individually...")
-        print(f"       [INFO] Using {request_delay}s delay between requests")
-        results = []
-        for i, single_text in enumerate(text, 1):
-            if i > 1:
-                time.sleep(request_delay)  # Use configurable delay to avoid rate limiting
-            result = translate_text_deepl(single_text, target_lang, api_url, endpoint_type, max_retries, request_delay)
-            if result is None:
-                return None
-            results.append(result)
-            if i % 10 == 0:
-                print(f"       [INFO] Progress: {i}/{len(text)} texts translated")
-        return results
+        return await translate_texts_individually(client, text, target_lang, api_url, endpoint_type, max_retries, limiter)
+
+    # Prepare request body based on endpoint type
+    if endpoint_type == "official":
+        # Official endpoint supports array format for batch
+        data = {
+            "text": text if is_batch else [text],
+            "target_lang": target_lang
+        }
+        body = json_dumps(data)
+    elif is_batch:
+        # Batch mode - use array format (for pro endpoint)
+        data = {
+            "text": text,
+            "source_lang": "EN",
+            "target_lang": target_lang
+        }
+        body = json_dumps(data)
+    else:
+        # Single text - use string format (as per official docs). The schema
+        # is fixed, so fill in a template instead of running json.dumps
+        body = (
+            f'{{"text":{_json_string(text)},"source_lang":"EN",'
+            f'"target_lang":{_json_string(target_lang)}}}'
+        ).encode('ascii')
 
     for attempt in range(max_retries):
+        # Fail fast while the circuit breaker is open (reported once when it opened)
+        if not circuit_allows_request():
+            return None
+
         try:
-            # Prepare request data based on endpoint type
-            if endpoint_type == "official":
-                # Official endpoint supports array format for batch
-                data = {
-                    "text": text if is_batch else [text],
-                    "target_lang": target_lang
-                }
+            async with limiter:
+                response = await client.post(api_url, content=body, headers=JSON_HEADERS)
+            if response.status_code in (429, 503):
+                # Rate limits come from a live server asking us to wait - they are
+                # handled by the backoff below and don't count against the
+                # breaker, but they do prove the server is up to a half-open probe
+                if _breaker['state'] == 'half_open':
+                    record_request_result(True)
             else:
-                # Free and Pro endpoints
-                if is_batch:
-                    # Batch mode - use array format (for pro endpoint)
-                    data = {
-                        "text": text,
-                        "source_lang": "EN",
-                        "target_lang": target_lang
-                    }
-                else:
-                    # Single text - use string format (as per official docs)
-                    data = {
-                        "text": text,  # text is already a string here
-                        "source_lang": "EN",
-                        "target_lang": target_lang
-                    }
-
-            response = httpx.post(url=api_url, json=data, timeout=30.0)
+                record_request_result(response.status_code == 200)
 
             if response.status_code == 200:
-                result = response.json()
+                result = json_loads(response.content)
 
                 # Handle different response formats
                 # All endpoints should return: {"translations": [{"text": "..."}]}
                 if 'translations' in result and len(result['translations']) > 0:
-                    if is_batch:
-                        return [t['text'] for t in result['translations']]
-                    else:
+                    if not is_batch:
                         return result['translations'][0]['text']
+                    translations = [t['text'] for t in result['translations']]
+                    if len(translations) == len(text):
+                        return translations
+                    # Partial batch result - fall back to one request per text
+                    print(f"       ⚠ Warning: API returned {len(translations)} translations for {len(text)} texts, retrying individually")
+                    return await translate_texts_individually(client, text, target_lang, api_url, endpoint_type, max_retries, limiter)
                 # Fallback for older DeepLX versions that return {"data": "..."}
                 elif 'data' in result:
-                    # This format doesn't support batch translation properly
+                    # This format doesn't support batch translation - fall back to one request per text
                     if is_batch:
-                        print(f"       ⚠ Warning: API returned single 'data' field for batch request")
-                        return None
+                        print(f"       ⚠ Warning: API returned single 'data' field for batch request, retrying individually")
+                        return await translate_texts_individually(client, text, target_lang, api_url, endpoint_type, max_retries, limiter)
                     else:
                         return result['data']
 
                 print(f"       ⚠ Unexpected response format: {result}")
                 return None
 
-            elif response.status_code == 503:
-                # Rate limit hit - use exponential backoff
-                wait_time = (2 ** attempt) * 5  # 5s, 10s, 20s
-                print(f"       ⚠ Rate limit hit. Waiting {wait_time}s before retry... (attempt {attempt + 1}/{max_retries})")
-                time.sleep(wait_time)
+            elif response.status_code in (429, 503):
+                if attempt == max_retries - 1:
+                    # No retries left - don't wait for nothing
+                    print(f"       ✗ Translation failed after {max_retries} attempts: rate limited (HTTP {response.status_code})")
+                    return None
+                # Rate limit hit - honor Retry-After, else jittered exponential backoff
+                wait_time = retry_after_seconds(response)
+                if wait_time is None:
+                    wait_time = jittered((2 ** attempt) * 5)  # ~5s, 10s, 20s
+                print(f"       ⚠ Rate limit hit. Waiting {wait_time:.1f}s before retry... (attempt {attempt + 1}/{max_retries})")
+                await asyncio.sleep(wait_time)
             else:
                 error_msg = f"HTTP {response.status_code}: {response.text}"
                 if attempt < max_retries - 1:
-                    wait_time = (attempt + 1) * 2
-                    print(f"       ⚠ Error: {error_msg}. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
+                    wait_time = jittered((attempt + 1) * 2)
+                    print(f"       ⚠ Error: {error_msg}. Retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
+                    await asyncio.sleep(wait_time)
                 else:
                     print(f"       ✗ Translation failed after {max_retries} attempts: {error_msg}")
                     return None
 
         except (httpx.RequestError, httpx.HTTPStatusError) as e:
+            record_request_result(False)
             if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 2
-                print(f"       ⚠ Error: {e}. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-                time.sleep(wait_time)
+                wait_time = jittered((attempt + 1) * 2)
+                print(f"       ⚠ Error: {e}. Retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
+                await asyncio.sleep(wait_time)
             else:
                 print(f"       ✗ Translation failed after {max_retries} attempts: {e}")
                 return None
 
     return None
 
-def translate_entries(results, api_url, endpoint_type="free", batch_size=10, delay=0.5, dry_run=False):
+def po_escape(text):
+    """Escape plain text for use inside a quoted .po string"""
+    return text.translate(_PO_ESCAPE_TABLE)
+
+def po_unescape(value):
+    """Turn the contents of a quoted .po string back into plain text"""
+    if '\\' not in value:
+        return value
+    return _PO_UNESCAPE_RE.sub(lambda m: _PO_UNESCAPES.get(m.group(1), m.group(1)), value)
+
+def needs_translation(msgid):
+    """Check whether a msgid has any text besides placeholders and markup"""
+    return any(c.isalpha() for c in _PLACEHOLDER_RE.sub('', msgid))
+
+def pack_batches(msgids, max_texts, max_bytes=MAX_BATCH_BYTES):
+    """Greedily pack msgids into batches
+
+    A batch is closed when it holds `max_texts` msgids or when adding the
+    next msgid would push its encoded size past `max_bytes`. Sizes are
+    measured as ASCII-escaped JSON strings, the largest form the text takes
+    on the wire. A single msgid larger than `max_bytes` gets a batch of its own.
+    """
+    batch = []
+    batch_bytes = 0
+    for msgid in msgids:
+        size = len(_json_string(po_unescape(msgid)))
+        if batch and (len(batch) >= max_texts or batch_bytes + size > max_bytes):
+            yield batch
+            batch = []
+            batch_bytes = 0
+        batch.append(msgid)
+        batch_bytes += size
+    if batch:
+        yield batch
+
+def write_translations(pending, translations):
+    """Write translated msgstrs back to their .po files
+
+    Args:
+        pending: Dictionary mapping (deepl_code, msgid) to the list of
+            (po_file, entry) pairs that need that translation
+        translations: Dictionary mapping (deepl_code, msgid) to its translation
+
+    Returns:
+        Number of entries written
+    """
+    patches = defaultdict(list)
+    for key, targets in pending.items():
+        if key in translations:
+            for po_file, entry in targets:
+                patches[po_file].append((entry.msgstr_span, translations[key]))
+
+    total_written = 0
+    for po_file, file_patches in sorted(patches.items()):
+        with open(po_file, 'r', encoding='utf-8', newline='') as f:
+            content = f.read()
+        # Only patch spans that still hold an empty msgstr - the file may have
+        # changed since it was scanned
+        valid = [(span, msgstr) for span, msgstr in file_patches
+                 if content[span[0]:span[1]] == 'msgstr ""']
+        if len(valid) < len(file_patches):
+            print(f"  ⚠ {po_file} changed since it was scanned, "
+                  f"skipping {len(file_patches) - len(valid)} entries")
+        if not valid:
+            continue
+        with open(po_file, 'w', encoding='utf-8', newline='') as f:
+            f.write(apply_msgstr_patches(content, valid))
+        total_written += len(valid)
+        print(f"  ✓ Updated {po_file} ({len(valid)} entries)")
+
+    return total_written
+
+async def translate_entries(results, api_url, endpoint_type="free", batch_size=MAX_BATCH_TEXTS, delay=0.5, concurrency=4, dry_run=False, cache=None):
     """Translate all untranslated entries using DeepL with batch support
 
+    Identical msgids are translated once per target language, even when they
+    appear in several .po files. Batches are sent concurrently (up to
+    `concurrency` requests in flight) and the files are written once all
+    batches have completed.
+
     Args:
         results: Dictionary of po files and their untranslated entries
         api_url: DeepL API endpoint URL
         endpoint_type: Type of endpoint ('free', 'pro', 'official')
-        batch_size: Number of entries to translate in one request
-        delay: Delay between batch requests in seconds
+        batch_size: Maximum number of entries to translate in one request,
+            capped at MAX_BATCH_TEXTS; batches are also limited to
+            MAX_BATCH_BYTES of encoded text
+        delay: Minimum delay between request starts in seconds
+        concurrency: Maximum number of requests in flight at once
         dry_run: If True, don't actually translate
+        cache: Optional translation cache from open_cache();
+            cached msgids are not sent to DeepL
     """
-    total_translated = 0
+    batch_size = min(batch_size, MAX_BATCH_TEXTS)
     consecutive_failures = 0
     max_consecutive_failures = 3
+    stopped = False
 
+    # Group entries by (target language, msgid) so each string is translated once
+    pending = defaultdict(list)
     for po_file, data in sorted(results.items()):
-        lang_name = data['lang_name']
-        lang_code = data['lang_code']
-        deepl_code = data['deepl_code']
-        untranslated = data['untranslated']
-
         print(f"\nProcessing: {po_file}")
-        print(f"Language: {lang_name} ({lang_code} -> DeepL: {deepl_code})")
-        print(f"Endpoint: {endpoint_type}")
-        print(f"Batch size: {batch_size}")
-        print(f"Untranslated entries: {len(untranslated)}")
+        print(f"Language: {data['lang_name']} ({data['lang_code']} -> DeepL: {data['deepl_code']})")
+        print(f"Untranslated entries: {len(data['untranslated'])}")
+        for entry in data['untranslated']:
+            pending[(data['deepl_code'], entry.msgid)].append((po_file, entry))
 
-        if dry_run:
-            print("  [DRY RUN] Skipping actual translation")
-            continue
+    print()
+    print(f"Endpoint: {endpoint_type}")
+    if endpoint_type == "free":
+        print("  [INFO] Free endpoint doesn't support batch, texts are translated individually")
+    print(f"Batch size: {batch_size}")
+    print(f"Concurrency: {concurrency}")
+    print(f"Unique strings to translate: {len(pending)}")
+
+    if dry_run:
+        print("  [DRY RUN] Skipping actual translation")
+        return 0
+
+    translations = {}
+    msgids_by_lang = defaultdict(list)
+    for deepl_code, msgid in pending:
+        if needs_translation(msgid):
+            msgids_by_lang[deepl_code].append(msgid)
+        else:
+            # Placeholder-only strings are kept as-is
+            translations[(deepl_code, msgid)] = msgid
+
+    if translations:
+        print(f"Placeholder-only strings (copied as-is): {len(translations)}")
+    skipped = len(translations)
+
+    batches = []
+    for deepl_code, msgids in msgids_by_lang.items():
+        if cache:
+            cached = cache_lookup(cache, msgids, deepl_code)
+            translations.update(((deepl_code, msgid), text) for msgid, text in cached.items())
+            msgids = [msgid for msgid in msgids if msgid not in cached]
+        batches.extend((deepl_code, batch) for batch in pack_batches(msgids, batch_size))
+
+    if len(translations) > skipped:
+        print(f"Cached translations: {len(translations) - skipped}")
+
+    limiter = RequestLimiter(concurrency, delay)
+
+    async with create_client() as client:
+        if batches:
+            await warm_up_client(client, api_url)
+
+        async def translate_batch(batch_idx, deepl_code, msgids):
+            # msgids are kept in their escaped .po form; DeepL gets the plain text
+            texts = [po_unescape(msgid) for msgid in msgids]
+            result = await translate_text_deepl(client, texts, deepl_code, api_url, endpoint_type, limiter=limiter)
+            if result:
+                result = [po_escape(text) for text in result]
+            return batch_idx, deepl_code, msgids, result
+
+        tasks = [
+            asyncio.create_task(translate_batch(idx, deepl_code, msgids))
+            for idx, (deepl_code, msgids) in enumerate(batches)
+        ]
+
+        # Report progress about ten times per run rather than once per batch
+        progress_step = max(1, len(batches) // 10)
+        translated_count = 0
 
-        # Read the original file
-        with open(po_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        try:
+            # Collect batches as they complete
+            for done, next_batch in enumerate(asyncio.as_completed(tasks), 1):
+                batch_idx, deepl_code, msgids, result = await next_batch
+                label = f"  Batch [{batch_idx + 1}/{len(batches)}] ({deepl_code})"
+
+                if result and len(result) == len(msgids):
+                    fresh = dict(zip(msgids, result))
+                    if cache:
+                        cache_store(cache, fresh, deepl_code)
+                    translations.update(((deepl_code, msgid), text) for msgid, text in fresh.items())
+
+                    consecutive_failures = 0  # Reset failure counter on success
+                    translated_count += len(msgids)
+                else:
+                    consecutive_failures += 1
+                    print(f"{label} ✗ Failed to translate batch (consecutive failures: {consecutive_failures})")
 
-        # Process in batches
-        total_batches = (len(untranslated) + batch_size - 1) // batch_size
-
-        for batch_idx in range(total_batches):
-            # Check if we should stop due to too many consecutive failures
-            if consecutive_failures >= max_consecutive_failures:
-                print(f"\n⚠ Stopping translation: {consecutive_failures} consecutive failures detected.")
-                print("This usually means:")
-                print("  1. Your IP has been rate-limited by DeepL")
-                print("  2. The DeepL service is temporarily unavailable")
-                print("\nSuggestions:")
-                print("  - Wait 30-60 minutes before trying again")
-                print("  - Use a longer --delay (e.g., --delay 5.0)")
-                print("  - Consider using a different DeepL endpoint or API key")
-                print(f"\nProgress saved: {total_translated} entries translated so far")
-                return total_translated
-
-            # Get batch of entries
-            start_idx = batch_idx * batch_size
-            end_idx = min(start_idx + batch_size, len(untranslated))
-            batch_entries = untranslated[start_idx:end_idx]
-
-            # Extract msgids for batch translation
-            batch_msgids = [entry['msgid'] for entry in batch_entries if entry['msgid']]
-
-            if not batch_msgids:
-                continue
-
-            print(f"  Batch [{batch_idx + 1}/{total_batches}] Translating {len(batch_msgids)} entries...")
-
-            # Translate batch
-            translations = translate_text_deepl(batch_msgids, deepl_code, api_url, endpoint_type, request_delay=delay)
-
-            if translations and len(translations) == len(batch_msgids):
-                # Apply translations to entries
-                for idx, entry in enumerate(batch_entries):
-                    if entry['msgid'] and idx < len(translations):
-                        translation = translations[idx]
-                        old_block = entry['block']
-                        new_block = old_block.replace('msgstr ""', f'msgstr "{translation}"')
-                        content = content.replace(old_block, new_block)
-                        total_translated += 1
-
-                consecutive_failures = 0  # Reset failure counter on success
-                print(f"       ✓ Successfully translated {len(translations)} entries")
-            else:
-                consecutive_failures += 1
-                print(f"       ✗ Failed to translate batch (consecutive failures: {consecutive_failures})")
+                if done % progress_step == 0 or done == len(batches):
+                    print(f"  Progress: {done}/{len(batches)} batches, {translated_count} strings translated")
 
-            # Add delay between batch requests
-            if batch_idx < total_batches - 1:
-                time.sleep(delay)
+                # Stop if there are too many consecutive failures
+                if consecutive_failures >= max_consecutive_failures:
+                    stopped = True
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Write back to file
-        if total_translated > 0:
-            with open(po_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"  ✓ Updated {po_file}")
+    print()
+    total_translated = write_translations(pending, translations)
+
+    if stopped:
+        print(f"\n⚠ Stopping translation: {consecutive_failures} consecutive failures detected.")
+        print("This usually means:")
+        print("  1. Your IP has been rate-limited by DeepL")
+        print("  2. The DeepL service is temporarily unavailable")
+        print("\nSuggestions:")
+        print("  - Wait 30-60 minutes before trying again")
+        print("  - Use a longer --delay (e.g., --delay 5.0) or a lower --concurrency")
+        print("  - Consider using a different DeepL endpoint or API key")
+        print(f"\nProgress saved: {total_translated} entries translated so far")
 
     return total_translated
 
@@ -368,7 +870,7 @@ def print_report(results):
 
         # Show first 5 untranslated entries as examples
         for i, entry in enumerate(data['untranslated'][:5]):
-            print(f"  [{i+1}] msgid: {entry['msgid'][:60]}...")
+            print(f"  [{i+1}] msgid: {entry.msgid[:60]}...")
 
         if len(data['untranslated']) > 5:
             print(f"  ... and {len(data['untranslated']) - 5} more")
@@ -378,6 +880,13 @@ def print_report(results):
     print(f"Total untranslated entries: {total_untranslated}")
     print("=" * 80)
 
+def positive_int(value):
+    """argparse type for options that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(
         description='Auto-translate empty msgstr entries in .po files using DeepL'
@@ -401,15 +910,32 @@ def main():
     )
     parser.add_argument(
         '--batch-size',
-        type=int,
-        default=10,
-        help='Number of entries to translate in one batch request (default: 10)'
+        type=positive_int,
+        default=MAX_BATCH_TEXTS,
+        help=f'Maximum number of entries to translate in one batch request (default and maximum: {MAX_BATCH_TEXTS}, the DeepL limit)'
     )
     parser.add_argument(
         '--delay',
         type=float,
         default=0.5,
-        help='Delay between batch requests in seconds (default: 0.5, increase if rate limited)'
+        help='Minimum delay between request starts in seconds (default: 0.5, increase if rate limited)'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=positive_int,
+        default=4,
+        help='Maximum number of translation requests in flight at once (default: 4)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the translation and parse cache'
+    )
+    parser.add_argument(
+        '--cache-file',
+        type=Path,
+        default=CACHE_FILE,
+        help=f'Location of the translation and parse cache (default: {CACHE_FILE})'
     )
     parser.add_argument(
         '--dry-run',
@@ -434,29 +960,42 @@ def main():
     print(f"Scanning .po files in: {po_dir}")
     print()
 
-    results = find_untranslated_entries(po_dir)
-
-    if not results:
-        print("No untranslated entries found!")
-        return
-
-    if args.mode == 'report':
-        print_report(results)
-    elif args.mode == 'translate':
-        print_report(results)
-        print()
-
-        if not args.dry_run and not args.yes:
-            confirm = input("Proceed with translation? (yes/no): ")
-            if confirm.lower() != 'yes':
-                print("Translation cancelled")
-                return
-
-        total = translate_entries(results, args.api_url, args.endpoint, args.batch_size, args.delay, args.dry_run)
-        print()
-        print("=" * 80)
-        print(f"Translation complete! Translated {total} entries")
-        print("=" * 80)
+    cache = None if args.no_cache else open_cache(args.cache_file)
+    try:
+        results = find_untranslated_entries(po_dir, cache)
+
+        if not results:
+            print("No untranslated entries found!")
+            return
+
+        if args.mode == 'report':
+            print_report(results)
+        elif args.mode == 'translate':
+            print_report(results)
+            print()
+
+            if not args.dry_run and not args.yes:
+                confirm = input("Proceed with translation? (yes/no): ")
+                if confirm.lower() != 'yes':
+                    print("Translation cancelled")
+                    return
+
+            run = getattr(uvloop, 'run', None)
+            if run is None:
+                if uvloop:
+                    # uvloop < 0.18 has no run(); install its event loop policy instead
+                    uvloop.install()
+                run = asyncio.run
+            total = run(translate_entries(
+                results, args.api_url, args.endpoint, args.batch_size, args.delay, args.concurrency, args.dry_run, cache
+            ))
+            print()
+            print("=" * 80)
+            print(f"Translation complete! Translated {total} entries")
+            print("=" * 80)
+    finally:
+        if cache:
+            cache.close()
 
 if __name__ == '__main__':
     main()